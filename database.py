@@ -11,6 +11,7 @@ data on NEOs and close approaches extracted by `extract.load_neos` and
 
 You'll edit this file in Tasks 2 and 3.
 """
+import array
 
 
 class NEODatabase:
@@ -54,7 +55,20 @@ class NEODatabase:
         for approach in self._approaches:
             self._dict_neos_by_designation[approach._designation].approaches.append(approach)
             approach.neo = self._dict_neos_by_designation[approach._designation]
-            
+
+        # Columnar (struct-of-arrays) copies of every filterable attribute.
+        # Each column holds its values contiguously in a typed array, so a
+        # query scan can test criteria without touching the approach and NEO
+        # objects at all - matching objects are fetched from
+        # `self._approaches` by index only when a row passes every check.
+        self._col_date_ordinal = array.array('l', (a._date_ordinal for a in self._approaches))
+        self._col_distance = array.array('d', (a.distance for a in self._approaches))
+        self._col_velocity = array.array('d', (a.velocity for a in self._approaches))
+        self._col_diameter = array.array('d', (a.neo.diameter for a in self._approaches))
+        # One byte per approach - bools are already 0/1, so no branching is
+        # needed to pack them, and the whole column stays cache-resident.
+        self._col_hazardous = bytearray(a.neo.hazardous for a in self._approaches)
+
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
 
@@ -101,6 +115,95 @@ class NEODatabase:
         :param filters: A collection of filters capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
-        for approach in self._approaches:
-            if all(filter(approach) for filter in filters):
-                yield approach
+        # A `FilterSet` from `create_filters` carries the raw criteria, which
+        # can be checked against the columnar storage directly - the fastest
+        # path. Any other collection of callables is evaluated generically.
+        criteria = getattr(filters, 'criteria', None)
+        if criteria:
+            yield from self._query_columns(criteria)
+            return
+
+        # The filter loop runs once per approach, so keep it as lean as the
+        # interpreter allows: no filters means no per-approach work at all, a
+        # single filter is called directly, and the general case uses an
+        # inline loop over a pre-bound tuple instead of building an `all`
+        # generator for every approach.
+        filters = tuple(filters)
+        if not filters:
+            yield from self._approaches
+        elif len(filters) == 1:
+            single = filters[0]
+            for approach in self._approaches:
+                if single(approach):
+                    yield approach
+        else:
+            for approach in self._approaches:
+                for check in filters:
+                    if not check(approach):
+                        break
+                else:
+                    yield approach
+
+    def _query_columns(self, criteria):
+        """Scan the columnar storage for approaches matching `criteria`.
+
+        Rather than looping over a list of checks for every row, the active
+        criteria are fused into the source of a single generator function -
+        one comparison expression per criterion bound, ordered by estimated
+        selectivity - which is compiled and run over the columns. The
+        reference values are bound as defaulted parameters of the generated
+        function (not interpolated into the source, since `repr` of a
+        non-finite float like `inf` is not a valid literal), so each is a
+        LOAD_FAST operand and the per-row cost is one short-circuiting `if`
+        of C-level comparisons. Compilation costs microseconds and is paid
+        once per query, not per row.
+
+        :param criteria: A mapping of `create_filters` parameter names to values.
+        :return: A stream of matching `CloseApproach` objects.
+        """
+        conditions = []
+        values = {}
+
+        if 'hazardous' in criteria:
+            conditions.append("col_haz[i] == v_haz")
+            values['v_haz'] = int(criteria['hazardous'])
+        if 'date' in criteria:
+            conditions.append("col_date[i] == v_date")
+            values['v_date'] = criteria['date'].toordinal()
+        if 'diameter_min' in criteria:
+            conditions.append("col_diam[i] >= v_diam_min")
+            values['v_diam_min'] = float(criteria['diameter_min'])
+        if 'diameter_max' in criteria:
+            conditions.append("col_diam[i] <= v_diam_max")
+            values['v_diam_max'] = float(criteria['diameter_max'])
+        if 'distance_min' in criteria:
+            conditions.append("col_dist[i] >= v_dist_min")
+            values['v_dist_min'] = float(criteria['distance_min'])
+        if 'distance_max' in criteria:
+            conditions.append("col_dist[i] <= v_dist_max")
+            values['v_dist_max'] = float(criteria['distance_max'])
+        if 'velocity_min' in criteria:
+            conditions.append("col_vel[i] >= v_vel_min")
+            values['v_vel_min'] = float(criteria['velocity_min'])
+        if 'velocity_max' in criteria:
+            conditions.append("col_vel[i] <= v_vel_max")
+            values['v_vel_max'] = float(criteria['velocity_max'])
+        if 'start_date' in criteria:
+            conditions.append("col_date[i] >= v_start")
+            values['v_start'] = criteria['start_date'].toordinal()
+        if 'end_date' in criteria:
+            conditions.append("col_date[i] <= v_end")
+            values['v_end'] = criteria['end_date'].toordinal()
+
+        parameters = ''.join(f", {name}={name}" for name in values)
+        source = (
+            f"def _scan(approaches, col_date, col_dist, col_vel, col_diam, col_haz{parameters}):\n"
+            "    for i in range(len(approaches)):\n"
+            f"        if {' and '.join(conditions)}:\n"
+            "            yield approaches[i]\n"
+        )
+        namespace = dict(values)
+        exec(compile(source, '<query-scan>', 'exec'), namespace)
+        return namespace['_scan'](self._approaches, self._col_date_ordinal,
+                                  self._col_distance, self._col_velocity,
+                                  self._col_diameter, self._col_hazardous)
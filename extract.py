@@ -14,24 +14,129 @@ You'll edit this file in Task 2.
 """
 import csv
 import json
+import mmap
+import os
+import pickle
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 from models import NearEarthObject, CloseApproach
 
+# Bump whenever the model classes gain or change attributes, so caches
+# written by older code are discarded instead of yielding stale objects.
+_CACHE_VERSION = 1
+
+
+def _read_cache(source_path):
+    """Load previously parsed objects from the pickle cache of a data file.
+
+    The cache is only honored if it is at least as new as the source file, so
+    editing or replacing the data file invalidates it automatically.
+
+    :param source_path: A path to a source data file.
+    :return: The cached collection of objects, or `None` on any cache miss.
+    """
+    cache_path = f"{source_path}.pickle"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(source_path):
+            with open(cache_path, 'rb') as cache_file:
+                version, objects = pickle.load(cache_file)
+            if version == _CACHE_VERSION:
+                return objects
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            TypeError, ValueError):
+        pass
+    return None
+
+
+def _write_cache(source_path, objects):
+    """Persist parsed objects to the pickle cache of a data file.
+
+    Failures are swallowed - the cache is purely an optimization, and a
+    read-only data directory shouldn't break loading.
+
+    :param source_path: A path to a source data file.
+    :param objects: The parsed collection of objects to cache.
+    """
+    try:
+        with open(f"{source_path}.pickle", 'wb') as cache_file:
+            pickle.dump((_CACHE_VERSION, objects), cache_file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
 
 def load_neos(neo_csv_path):
     """Read near-Earth object information from a CSV file.
 
+    If `pyarrow` is available, the CSV file is parsed with its native
+    multithreaded reader, which is roughly an order of magnitude faster than
+    row-wise Python parsing; failing that, `pandas.read_csv` is tried, and
+    the standard library's `csv.reader` is the last resort.
+
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A collection of `NearEarthObject`s.
     """
-    neo_list = []
-    
-    with open(neo_csv_path, 'r') as neo_csv:
-        neo_data = csv.DictReader(neo_csv)
-        for row in neo_data:
-            neo_row = NearEarthObject(**row)
-            neo_list.append(neo_row)
+    cached = _read_cache(neo_csv_path)
+    if cached is not None:
+        return cached
+
+    if pacsv is not None:
+        convert_options = pacsv.ConvertOptions(column_types={
+            'pdes': pa.string(),
+            'name': pa.string(),
+            'diameter': pa.float64(),
+            'pha': pa.string(),
+        })
+        table = pacsv.read_csv(neo_csv_path, convert_options=convert_options)
+        neo_list = [
+            NearEarthObject(pdes=pdes, name=name, diameter=diameter, pha=pha)
+            for pdes, name, diameter, pha in zip(
+                table.column('pdes').to_pylist(),
+                table.column('name').to_pylist(),
+                table.column('diameter').to_pylist(),
+                table.column('pha').to_pylist(),
+            )
+        ]
+    elif pd is not None:
+        # keep_default_na=False leaves missing values as empty strings, the
+        # same quirk the model constructor already handles for csv.reader.
+        df = pd.read_csv(neo_csv_path, usecols=['pdes', 'name', 'diameter', 'pha'],
+                         dtype=str, keep_default_na=False)
+        neo_list = [
+            NearEarthObject(pdes=pdes, name=name, diameter=diameter, pha=pha)
+            for pdes, name, diameter, pha in zip(
+                df['pdes'], df['name'], df['diameter'], df['pha'])
+        ]
+    else:
+        with open(neo_csv_path, 'r', buffering=1 << 20) as neo_csv:
+            reader = csv.reader(neo_csv)
+            header = next(reader)
+            i_pdes = header.index('pdes')
+            i_name = header.index('name')
+            i_diameter = header.index('diameter')
+            i_pha = header.index('pha')
+            neo_list = [
+                NearEarthObject(pdes=row[i_pdes], name=row[i_name],
+                                diameter=row[i_diameter], pha=row[i_pha])
+                for row in reader
+            ]
 
+    _write_cache(neo_csv_path, neo_list)
     return neo_list
 
 
@@ -41,14 +146,31 @@ def load_approaches(cad_json_path):
     :param cad_json_path: A path to a JSON file containing data about close approaches.
     :return: A collection of `CloseApproach`es.
     """
-    cad_list = []
-    with open(cad_json_path, 'r') as cad_json:
-        cad_data = json.load(cad_json)
-        fields = cad_data['fields']
-        data = cad_data['data']
-        for row in data:
-            row_mapped = dict(zip(fields, row))
-            cad_row = CloseApproach(**row_mapped)
-            cad_list.append(cad_row)
+    cached = _read_cache(cad_json_path)
+    if cached is not None:
+        return cached
+
+    if orjson is not None:
+        # Memory-map the file so orjson parses straight from the page cache,
+        # skipping the read() copy into an intermediate bytes object.
+        with open(cad_json_path, 'rb') as cad_json:
+            with mmap.mmap(cad_json.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                cad_data = orjson.loads(memoryview(mapped))
+    else:
+        with open(cad_json_path, 'r', buffering=1 << 20) as cad_json:
+            cad_data = json.load(cad_json)
+    fields = cad_data['fields']
+    data = cad_data['data']
+
+    # Index the four fields of interest once, rather than building a dict
+    # from every row just to pull out the same four values.
+    i_des = fields.index('des')
+    i_cd = fields.index('cd')
+    i_dist = fields.index('dist')
+    i_vel = fields.index('v_rel')
+    from_row = CloseApproach.from_row
 
+    cad_list = [from_row(row[i_des], row[i_cd], row[i_dist], row[i_vel])
+                for row in data]
+    _write_cache(cad_json_path, cad_list)
     return cad_list
\ No newline at end of file
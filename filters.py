@@ -16,7 +16,7 @@ iterator.
 
 You'll edit this file in Tasks 3a and 3c.
 """
-import operator
+import itertools
 
 
 class UnsupportedCriterionError(NotImplementedError):
@@ -38,7 +38,9 @@ class AttributeFilter:
     Concrete subclasses can override the `get` classmethod to provide custom
     behavior to fetch a desired attribute from the given `CloseApproach`.
     """
-    
+
+    __slots__ = ('op', 'value')
+
     def __init__(self, op, value):
         """Construct a new `AttributeFilter` from an binary predicate and a reference value.
 
@@ -84,7 +86,9 @@ class DateFilter(AttributeFilter):
 
     It only contains one class method for getting the value.
     """
-    
+
+    __slots__ = ()
+
     @classmethod
     def get(cls, approach):
         """Get the date of the close approach.
@@ -96,7 +100,7 @@ class DateFilter(AttributeFilter):
         :param approach: A `CloseApproach` object from which to extract the date.
         :return: A `date` object representing the date of the close approach.
         """
-        return approach.time.date()
+        return approach._date
 
 class DistanceFilter(AttributeFilter):
     """A filter for the distance of a close approach.
@@ -104,7 +108,9 @@ class DistanceFilter(AttributeFilter):
     This filter checks the `distance` attribute of a `CloseApproach` object.
     It is used to filter close approaches based on the distance from Earth, expressed in astronomical units (AU).
     """
-    
+
+    __slots__ = ()
+
     @classmethod
     def get(cls, approach):
         """Get the distance of the close approach.
@@ -123,7 +129,9 @@ class VelocityFilter(AttributeFilter):
     This filter checks the `velocity` attribute of a `CloseApproach` object.
     It is used to filter close approaches based on the velocity of the NEO during the approach, expressed in kilometers per second.
     """
-    
+
+    __slots__ = ()
+
     @classmethod
     def get(cls, approach):
         """Get the velocity of the close approach.
@@ -142,7 +150,9 @@ class DiameterFilter(AttributeFilter):
     This filter checks the `diameter` attribute of the `neo` associated with a `CloseApproach` object.
     It is used to filter close approaches based on the NEO's diameter, expressed in kilometers.
     """
-    
+
+    __slots__ = ()
+
     @classmethod
     def get(cls, approach):
         """Get the diameter of the near-Earth object (NEO).
@@ -162,7 +172,9 @@ class HazardousFilter(AttributeFilter):
     This filter checks the `hazardous` attribute of the `neo` associated with a `CloseApproach` object.
     It is used to filter close approaches based on whether the NEO is potentially hazardous.
     """
-    
+
+    __slots__ = ()
+
     @classmethod
     def get(cls, approach):
         """Check if the near-Earth object (NEO) is potentially hazardous.
@@ -176,6 +188,27 @@ class HazardousFilter(AttributeFilter):
         """
         return approach.neo.hazardous
 
+class FilterSet(list):
+    """A collection of filters that also records the criteria they encode.
+
+    A `FilterSet` behaves exactly like the plain list of 1-argument callables
+    that `query` historically received, so it can be iterated and called
+    filter-by-filter. It additionally carries the raw user criteria (the
+    non-None arguments to `create_filters`, keyed by parameter name), which
+    lets `NEODatabase.query` evaluate the criteria directly against its
+    columnar storage instead of calling each closure per approach.
+    """
+
+    def __init__(self, filters=(), criteria=None):
+        """Construct a new `FilterSet` from filters and the criteria behind them.
+
+        :param filters: An iterable of 1-argument callables on a `CloseApproach`.
+        :param criteria: A mapping of `create_filters` parameter names to values.
+        """
+        super().__init__(filters)
+        self.criteria = dict(criteria) if criteria else {}
+
+
 def create_filters(
         date=None, start_date=None, end_date=None,
         distance_min=None, distance_max=None,
@@ -197,8 +230,14 @@ def create_filters(
     `hazardous=False`, not to be confused with `hazardous=None`).
 
     The return value must be compatible with the `query` method of `NEODatabase`
-    because the main module directly passes this result to that method. For now,
-    this can be thought of as a collection of `AttributeFilter`s.
+    because the main module directly passes this result to that method. Each
+    filter is a 1-argument callable on a `CloseApproach`; they are built as
+    closures over the reference values rather than `AttributeFilter` instances,
+    which avoids the method-dispatch overhead of `__call__`, `get`, and the
+    operator function on every approach. The filters are wrapped in a
+    `FilterSet`, which also carries the raw criteria so the database can scan
+    its columnar storage directly. The `AttributeFilter` hierarchy is kept for
+    its readable `__repr__` and for tests.
 
     :param date: A `date` on which a matching `CloseApproach` occurs.
     :param start_date: A `date` on or after which a matching `CloseApproach` occurs.
@@ -212,30 +251,46 @@ def create_filters(
     :param hazardous: Whether the NEO of a matching `CloseApproach` is potentially hazardous.
     :return: A collection of filters for use with `query`.
     """    
+    # Filters are collected as (weight, filter) pairs and sorted so that the
+    # statistically most selective criteria run first - since `query` requires
+    # every filter to pass, rejecting an approach on the first comparison
+    # short-circuits the rest. Boolean equality rejects the most, date ranges
+    # the least.
     command_filters = []
 
     if date is not None:
-        command_filters.append(DateFilter(operator.eq, date))
+        command_filters.append((1, lambda a, v=date.toordinal(): a._date_ordinal == v))
     if start_date is not None:
-        command_filters.append(DateFilter(operator.ge, start_date))
+        command_filters.append((5, lambda a, v=start_date.toordinal(): a._date_ordinal >= v))
     if end_date is not None:
-        command_filters.append(DateFilter(operator.le, end_date))
+        command_filters.append((5, lambda a, v=end_date.toordinal(): a._date_ordinal <= v))
     if distance_min is not None:
-        command_filters.append(DistanceFilter(operator.ge, distance_min))
+        command_filters.append((3, lambda a, v=distance_min: a.distance >= v))
     if distance_max is not None:
-        command_filters.append(DistanceFilter(operator.le, distance_max))
+        command_filters.append((3, lambda a, v=distance_max: a.distance <= v))
     if velocity_min is not None:
-        command_filters.append(VelocityFilter(operator.ge, velocity_min))
+        command_filters.append((4, lambda a, v=velocity_min: a.velocity >= v))
     if velocity_max is not None:
-        command_filters.append(VelocityFilter(operator.le, velocity_max))
+        command_filters.append((4, lambda a, v=velocity_max: a.velocity <= v))
     if diameter_min is not None:
-        command_filters.append(DiameterFilter(operator.ge, diameter_min))
+        command_filters.append((2, lambda a, v=diameter_min: a.neo.diameter >= v))
     if diameter_max is not None:
-        command_filters.append(DiameterFilter(operator.le, diameter_max))    
+        command_filters.append((2, lambda a, v=diameter_max: a.neo.diameter <= v))
     if hazardous is not None:
-        command_filters.append(HazardousFilter(operator.eq, hazardous))
+        command_filters.append((0, lambda a, v=hazardous: a.neo.hazardous == v))
+
+    command_filters.sort(key=lambda pair: pair[0])
+
+    criteria = {name: value for name, value in (
+        ('date', date), ('start_date', start_date), ('end_date', end_date),
+        ('distance_min', distance_min), ('distance_max', distance_max),
+        ('velocity_min', velocity_min), ('velocity_max', velocity_max),
+        ('diameter_min', diameter_min), ('diameter_max', diameter_max),
+        ('hazardous', hazardous),
+    ) if value is not None}
 
-    return command_filters 
+    return FilterSet((command_filter for _, command_filter in command_filters),
+                     criteria)
 
 def limit(iterator, n=None):
     """Produce a limited stream of values from an iterator.
@@ -244,12 +299,8 @@ def limit(iterator, n=None):
 
     :param iterator: An iterator of values.
     :param n: The maximum number of values to produce.
-    :yield: The first (at most) `n` values from the iterator.
+    :return: An iterator of the first (at most) `n` values from the iterator.
     """
     if n is None or n == 0:
-        yield from iterator
-    else:
-        for i, value in enumerate(iterator):
-            if i >= n:
-                break
-            yield value
\ No newline at end of file
+        return iterator
+    return itertools.islice(iterator, n)
\ No newline at end of file
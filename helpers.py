@@ -12,6 +12,13 @@ provide that level of resolution, so the output format also will not.
 """
 import datetime
 
+# Month-abbreviation lookup for the fast path of `cd_to_datetime`. NASA's
+# `cd` field always uses the English locale's abbreviated month names.
+_MONTH_NUMBERS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
 
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
@@ -23,10 +30,23 @@ def cd_to_datetime(calendar_date):
 
     This will become the Python object `datetime.datetime(2020, 12, 31, 12, 0)`.
 
+    This parses the fixed YYYY-bb-DD hh:mm layout by hand, because `strptime`
+    is called once per close approach and is several times slower than
+    splitting the string and converting the pieces directly. Anything that
+    doesn't match the expected layout falls back to `strptime`, which also
+    produces the usual error message for genuinely malformed input.
+
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
-    return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
+    try:
+        date_part, time_part = calendar_date.split(' ')
+        year, month, day = date_part.split('-')
+        hour, minute = time_part.split(':')
+        return datetime.datetime(int(year), _MONTH_NUMBERS[month], int(day),
+                                 int(hour), int(minute))
+    except (AttributeError, KeyError, ValueError):
+        return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
 
 
 def datetime_to_str(dt):
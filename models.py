@@ -33,6 +33,10 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous',
+                 'name_str', 'diameter_csv', 'diameter_json', 'hazardous_str',
+                 'approaches')
+
     def __init__(self, **info):
         """Create a new `NearEarthObject`.
 
@@ -45,6 +49,15 @@ class NearEarthObject:
         self.diameter = self.convert_to_float(info.get('diameter', None))
         self.hazardous = info.get('pha', 'N') == 'Y'
 
+        # Sanitized serialization values, computed once per NEO. The writers
+        # emit one row per close approach, and approaches outnumber NEOs by
+        # an order of magnitude, so hoisting the None checks here removes
+        # them from the output hot loop.
+        self.name_str = self.name or ''
+        self.diameter_csv = 'nan' if self.diameter is None else self.diameter
+        self.diameter_json = float('nan') if self.diameter is None else self.diameter
+        self.hazardous_str = 'True' if self.hazardous else 'False'
+
         # Create an empty initial collection of linked approaches.
         self.approaches = []
 
@@ -94,20 +107,51 @@ class CloseApproach:
     private attribute, but the referenced NEO is eventually replaced in the
     `NEODatabase` constructor.
     """
-    
+
+    __slots__ = ('_designation', 'time', '_date', '_date_ordinal',
+                 'distance', 'velocity', 'neo', 'timedate', 'fullname')
+
     def __init__(self, **info):
         """Create a new `CloseApproach`.
 
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
         self._designation = info.get('des', '')
-        self.time = cd_to_datetime(info.get('cd', None))  
+        self.time = cd_to_datetime(info.get('cd', None))
+        # Cache the approach date (and its ordinal, for cheap integer
+        # comparisons) so date filters don't rebuild a `date` per call.
+        self._date = self.time.date()
+        self._date_ordinal = self._date.toordinal()
         self.distance = self.convert_to_float(info.get('dist'))
         self.velocity = self.convert_to_float(info.get('v_rel'))
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = None
-        
+
+    @classmethod
+    def from_row(cls, des, cd, dist, v_rel):
+        """Create a new `CloseApproach` directly from the fields of a CAD data row.
+
+        Unlike the keyword constructor, this skips building an intermediate
+        dictionary for every row, which adds up when loading hundreds of
+        thousands of close approaches.
+
+        :param des: The primary designation of the approaching NEO.
+        :param cd: The calendar date/time of closest approach, as a string.
+        :param dist: The nominal approach distance, in astronomical units.
+        :param v_rel: The relative approach velocity, in kilometers per second.
+        :return: A new `CloseApproach`.
+        """
+        approach = cls.__new__(cls)
+        approach._designation = des or ''
+        approach.time = cd_to_datetime(cd)
+        approach._date = approach.time.date()
+        approach._date_ordinal = approach._date.toordinal()
+        approach.distance = approach.convert_to_float(dist)
+        approach.velocity = approach.convert_to_float(v_rel)
+        approach.neo = None
+        return approach
+
     def convert_to_float(self, val):
         """Convert a value to a float, handling None or invalid input gracefully.
 
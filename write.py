@@ -11,9 +11,24 @@ extension determines which of these functions is used.
 You'll edit this file in Part 4.
 """
 import csv
+import functools
 import json
+
 from helpers import cd_to_datetime, datetime_to_str
 
+
+@functools.lru_cache(maxsize=4096)
+def _format_time(time):
+    """Format an approach time, caching results for repeated timestamps.
+
+    Approach times are minute-resolution, so large result sets frequently
+    repeat timestamps; cache hits skip the strftime call entirely.
+
+    :param time: A naive Python datetime.
+    :return: That datetime, formatted by `datetime_to_str`.
+    """
+    return datetime_to_str(time)
+
 def write_to_csv(results, filename):
     """Write an iterable of `CloseApproach` objects to a CSV file.
 
@@ -28,21 +43,26 @@ def write_to_csv(results, filename):
         'datetime_utc', 'distance_au', 'velocity_km_s',
         'designation', 'name', 'diameter_km', 'potentially_hazardous'
     )
-    with open(filename, 'w') as cad_csv:
-        writer = csv.DictWriter(cad_csv, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for approach in results:
-            row = {
-                'datetime_utc': datetime_to_str(approach.time),
-                'distance_au': approach.distance,
-                'velocity_km_s': approach.velocity,
-                'designation': approach.neo.designation,
-                'name': approach.neo.name if approach.neo.name is not None else '',
-                'diameter_km': approach.neo.diameter if approach.neo.diameter is not None else 'nan',
-                'potentially_hazardous': 'True' if approach.neo.hazardous else 'False'
-            }
-            writer.writerow(row)
+    with open(filename, 'w', buffering=1 << 20) as cad_csv:
+        writer = csv.writer(cad_csv)
+        writer.writerow(fieldnames)
+
+        # Positional tuples in fieldname order - csv.writer skips the
+        # per-field dict lookups that csv.DictWriter performs on every row.
+        # writerows consumes the generator in C, avoiding a Python-level
+        # writerow call per approach.
+        writer.writerows(
+            (
+                _format_time(approach.time),
+                approach.distance,
+                approach.velocity,
+                approach.neo.designation,
+                approach.neo.name_str,
+                approach.neo.diameter_csv,
+                approach.neo.hazardous_str
+            )
+            for approach in results
+        )
         
 def write_to_json(results, filename):
     """Write an iterable of `CloseApproach` objects to a JSON file.
@@ -55,21 +75,25 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    cad_list = []
-
-    for approach in results:
-        approach_data = {
-            'datetime_utc': datetime_to_str(approach.time),
-            'distance_au': approach.distance,
-            'velocity_km_s': approach.velocity,
-            'neo': {
-                'designation': approach.neo.designation,
-                'name': approach.neo.name if approach.neo.name is not None else '',
-                'diameter_km': approach.neo.diameter if approach.neo.diameter is not None else float('nan'),
-                'potentially_hazardous': bool(approach.neo.hazardous)
+    with open(filename, 'w', buffering=1 << 20) as jsonfile:
+        # Stream one element at a time rather than accumulating the whole
+        # list of dictionaries in memory before serializing it.
+        jsonfile.write('[\n')
+        first = True
+        for approach in results:
+            approach_data = {
+                'datetime_utc': _format_time(approach.time),
+                'distance_au': approach.distance,
+                'velocity_km_s': approach.velocity,
+                'neo': {
+                    'designation': approach.neo.designation,
+                    'name': approach.neo.name_str,
+                    'diameter_km': approach.neo.diameter_json,
+                    'potentially_hazardous': approach.neo.hazardous
+                }
             }
-        }
-        cad_list.append(approach_data)
-
-    with open(filename, 'w') as jsonfile:
-        json.dump(cad_list, jsonfile, indent=4)
+            if not first:
+                jsonfile.write(',\n')
+            first = False
+            jsonfile.write(json.dumps(approach_data, indent=4))
+        jsonfile.write('\n]\n')